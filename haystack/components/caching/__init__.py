@@ -2,15 +2,33 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import sys
-from typing import TYPE_CHECKING
-
-from lazy_imports import LazyImporter
+import importlib
+from typing import TYPE_CHECKING, Any
 
 _import_structure = {"cache_checker": ["CacheChecker"]}
 
+# Maps each exported name to the submodule defining it
+_lazy_attributes = {name: module for module, names in _import_structure.items() for name in names}
+
 if TYPE_CHECKING:
     from .cache_checker import CacheChecker as CacheChecker
 
-else:
-    sys.modules[__name__] = LazyImporter(name=__name__, module_file=__file__, import_structure=_import_structure)
+__all__ = ["CacheChecker"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the exported classes on first access (PEP 562).
+
+    The imported attribute is stored in the module globals, so later accesses don't go through this function.
+    """
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_lazy_attributes[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_lazy_attributes])
@@ -4,6 +4,8 @@
 
 from typing import Any, Protocol
 
+from haystack.dataclasses import Document
+
 # See https://github.com/pylint-dev/pylint/issues/9319.
 # pylint: disable=unnecessary-ellipsis
 
@@ -28,3 +30,25 @@ class TextEmbedder(Protocol):
                 - any optional keys such as 'metadata'.
         """
         ...
+
+
+class DocumentEmbedder(Protocol):
+    """
+    Protocol for Document Embedders.
+    """
+
+    def run(self, documents: list[Document]) -> dict[str, Any]:
+        """
+        Generate embeddings for the input documents.
+
+        Implementing classes may accept additional optional parameters in their run method.
+        For example: `def run (self, documents: list[Document], param_a="default", param_b="another_default")`.
+
+        :param documents:
+            The input documents to be embedded.
+        :returns:
+            A dictionary containing the keys:
+                - 'documents', which is expected to be a list[Document] with the `embedding` field set.
+                - any optional keys such as 'meta'.
+        """
+        ...
@@ -2,14 +2,44 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from statistics import mean
+import copy
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
 from typing import Any, Optional
 
-from haystack import component, default_from_dict, default_to_dict
+import numpy as np
+from tqdm import tqdm
+
+from haystack import component, default_from_dict, default_to_dict, logging
+from haystack.components.embedders.types import DocumentEmbedder
 from haystack.components.evaluators.llm_evaluator import LLMEvaluator
 from haystack.components.generators.chat.types import ChatGenerator
 from haystack.core.serialization import component_to_dict
+from haystack.dataclasses import Document
+from haystack.dataclasses.chat_message import ChatMessage
+from haystack.lazy_imports import LazyImport
 from haystack.utils import deserialize_chatgenerator_inplace
+from haystack.utils.deserialization import deserialize_component_inplace
+
+logger = logging.getLogger(__name__)
+
+# xxhash is an optional, faster non-cryptographic hash for the keys of duplicated and cached pairs
+with LazyImport(message="Run 'pip install xxhash'") as xxhash_import:
+    import xxhash
+
+
+def _hash_digest(data: bytes) -> bytes:
+    """
+    Hash bytes into a 64-bit digest with xxhash if it is installed, falling back to blake2b.
+
+    64-bit keys are more than enough to tell apart the pairs evaluated by a single process.
+    """
+    if xxhash_import.is_successful():
+        return xxhash.xxh3_64_digest(data)
+    return blake2b(data, digest_size=8).digest()
+
 
 # Private global variable for default examples to include in the prompt if the user does not provide any examples
 _DEFAULT_EXAMPLES = [
@@ -37,6 +67,14 @@ _DEFAULT_EXAMPLES = [
     },
 ]
 
+_INSTRUCTIONS = (
+    "Please extract only sentences from the provided context which are absolutely relevant and "
+    "required to answer the following question. If no relevant sentences are found, or if you "
+    "believe the question cannot be answered from the given context, return an empty list, example: []"
+)
+_INPUTS: list[tuple[str, type[list]]] = [("questions", list[str]), ("contexts", list[list[str]])]
+_OUTPUTS = ["relevant_statements"]
+
 
 @component
 class ContextRelevanceEvaluator(LLMEvaluator):
@@ -97,12 +135,24 @@ class ContextRelevanceEvaluator(LLMEvaluator):
     ```
     """
 
+    # The prompt template and examples section rendered from the default prompt are identical for all instances of
+    # this class, so they are rendered once and shared. Subclasses and custom examples are always rendered.
+    _default_template: Optional[str] = None
+    _default_examples_section: Optional[str] = None
+    _default_batch_examples_section: Optional[str] = None
+
     def __init__(  # pylint: disable=too-many-positional-arguments
         self,
         examples: Optional[list[dict[str, Any]]] = None,
         progress_bar: bool = True,
         raise_on_failure: bool = True,
         chat_generator: Optional[ChatGenerator] = None,
+        batch_size: int = 1,
+        max_workers: int = 3,
+        cache_results: bool = False,
+        max_cache_size: int = 10_000,
+        document_embedder: Optional[DocumentEmbedder] = None,
+        similarity_threshold: float = 0.95,
     ):
         """
         Creates an instance of ContextRelevanceEvaluator.
@@ -135,15 +185,53 @@ class ContextRelevanceEvaluator(LLMEvaluator):
             In order for the component to work, the LLM should be configured to return a JSON object. For example,
             when using the OpenAIChatGenerator, you should pass `{"response_format": {"type": "json_object"}}` in the
             `generation_kwargs`.
+        :param batch_size:
+            Number of question-contexts pairs to evaluate with a single LLM call.
+            With the default of 1, each pair is sent to the LLM in its own prompt. With a larger value, pairs are
+            grouped into numbered items of one prompt and the LLM is asked to return a JSON object with a `results`
+            list containing one entry per item, which reduces the number of LLM calls.
+        :param max_workers:
+            Maximum number of threads used to send batches to the LLM in parallel. Only used if `batch_size` is
+            greater than 1.
+        :param cache_results:
+            Whether to cache the evaluation results of question-contexts pairs in memory.
+            When a pair was already evaluated successfully by this instance, the cached result is returned instead of
+            calling the LLM again. Failed evaluations are never cached. Use `clear_cache` to empty the cache.
+        :param max_cache_size:
+            Maximum number of results kept in the cache. When the cache is full, the least recently used result is
+            evicted. Only used if `cache_results` is True.
+        :param document_embedder:
+            An optional DocumentEmbedder used for a second, similarity-based cache lookup. Only used if
+            `cache_results` is True. The pairs that are not found in the cache are embedded with a single call to the
+            embedder, and each embedding is compared with the embeddings of the cached pairs. The result of the most
+            similar cached pair is reused if the cosine similarity is at least `similarity_threshold`.
+            Note that a reused result contains the `relevant_statements` extracted from the contexts of the other
+            pair, verbatim. These statements may not appear in the contexts of the current pair.
+        :param similarity_threshold:
+            The minimum cosine similarity for a cached pair to be reused. Only used if `document_embedder` is set.
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer but received {batch_size}.")
+        if max_cache_size < 1:
+            raise ValueError(f"max_cache_size must be a positive integer but received {max_cache_size}.")
 
-        self.instructions = (
-            "Please extract only sentences from the provided context which are absolutely relevant and "
-            "required to answer the following question. If no relevant sentences are found, or if you "
-            "believe the question cannot be answered from the given context, return an empty list, example: []"
-        )
-        self.inputs = [("questions", list[str]), ("contexts", list[list[str]])]
-        self.outputs = ["relevant_statements"]
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.cache_results = cache_results
+        self.max_cache_size = max_cache_size
+        self.document_embedder = document_embedder
+        self.similarity_threshold = similarity_threshold
+        # cached results in least recently used order
+        self._cache: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+        # embeddings of the cached pairs, in the first rows of a matrix that grows as needed
+        self._cache_embeddings: Optional[np.ndarray] = None
+        # cache key of each used row of the embeddings matrix, and the other way around
+        self._cache_embedding_keys: list[bytes] = []
+        self._cache_embedding_rows: dict[bytes, int] = {}
+
+        self.instructions = _INSTRUCTIONS
+        self.inputs = _INPUTS
+        self.outputs = _OUTPUTS
         self.examples = examples or _DEFAULT_EXAMPLES
 
         super(ContextRelevanceEvaluator, self).__init__(
@@ -170,23 +258,408 @@ class ContextRelevanceEvaluator(LLMEvaluator):
                 - `score`: Mean context relevance score over all the provided input questions.
                 - `results`: A list of dictionaries with `relevant_statements` and `score` for each input context.
         """
-        result = super(ContextRelevanceEvaluator, self).run(**inputs)
+        result = self._run_deduplicated(**inputs)
 
+        # score each result and accumulate the total in a single pass over the results
+        individual_scores: list[float] = []
+        total = 0.0
         for idx, res in enumerate(result["results"]):
             if res is None:
-                result["results"][idx] = {"relevant_statements": [], "score": float("nan")}
-                continue
-            if len(res["relevant_statements"]) > 0:
-                res["score"] = 1
+                res = {"relevant_statements": [], "score": float("nan")}
+                result["results"][idx] = res
             else:
-                res["score"] = 0
+                res["score"] = 1 if len(res["relevant_statements"]) > 0 else 0
+            individual_scores.append(res["score"])
+            total += res["score"]
 
         # calculate average context relevance score over all queries
-        result["score"] = mean([res["score"] for res in result["results"]])
-        result["individual_scores"] = [res["score"] for res in result["results"]]  # useful for the EvaluationRunResult
+        result["score"] = total / len(individual_scores) if individual_scores else float("nan")
+        result["individual_scores"] = individual_scores  # useful for the EvaluationRunResult
 
         return result
 
+    def prepare_template(self) -> str:
+        """
+        Prepare the prompt template, reusing the one rendered by a previous instance when using the default prompt.
+
+        :returns:
+            The prompt template.
+        """
+        if not self._uses_default_prompt():
+            return super(ContextRelevanceEvaluator, self).prepare_template()
+        if ContextRelevanceEvaluator._default_template is None:
+            ContextRelevanceEvaluator._default_template = super(ContextRelevanceEvaluator, self).prepare_template()
+        return ContextRelevanceEvaluator._default_template
+
+    def prepare_examples_section(self) -> str:
+        """
+        Prepare the few-shot examples section, reusing the one rendered before when using the default prompt.
+
+        :returns:
+            The examples section.
+        """
+        if not self._uses_default_prompt():
+            return super(ContextRelevanceEvaluator, self).prepare_examples_section()
+        if ContextRelevanceEvaluator._default_examples_section is None:
+            ContextRelevanceEvaluator._default_examples_section = super(
+                ContextRelevanceEvaluator, self
+            ).prepare_examples_section()
+        return ContextRelevanceEvaluator._default_examples_section
+
+    def _prepare_batch_examples_section(self) -> str:
+        """
+        Prepare the few-shot examples section of the batched prompt, reusing the one rendered before by default.
+
+        The examples are rendered as a single batch of numbered items, with the outputs in the `results` format the
+        LLM is asked to return:
+        Items:
+        Item 1:
+        `<example inputs as JSON>`
+        Outputs:
+        `{"results": [<example outputs as JSON>, ...]}`
+
+        :returns:
+            The examples section.
+        """
+        if self._uses_default_prompt() and ContextRelevanceEvaluator._default_batch_examples_section is not None:
+            return ContextRelevanceEvaluator._default_batch_examples_section
+
+        items_section = "\n".join(
+            [f"Item {idx}:\n{json.dumps(example['inputs'])}" for idx, example in enumerate(self.examples, start=1)]
+        )
+        outputs = json.dumps({"results": [example["outputs"] for example in self.examples]})
+        examples_section = f"Items:\n{items_section}\nOutputs:\n{outputs}"
+        if self._uses_default_prompt():
+            ContextRelevanceEvaluator._default_batch_examples_section = examples_section
+        return examples_section
+
+    def _uses_default_prompt(self) -> bool:
+        """
+        Whether the prompt is built from the default instructions, inputs, outputs and examples.
+
+        Subclasses may change any of them, so only instances of this exact class are considered.
+        """
+        return type(self) is ContextRelevanceEvaluator and self.examples is _DEFAULT_EXAMPLES
+
+    def warm_up(self):
+        """
+        Warm up the document embedder used for the similarity-based cache lookup, if any.
+        """
+        if self.document_embedder is not None and hasattr(self.document_embedder, "warm_up"):
+            self.document_embedder.warm_up()
+
+    def clear_cache(self) -> None:
+        """
+        Remove all the cached results and their embeddings.
+        """
+        self._cache.clear()
+        self._cache_embeddings = None
+        self._cache_embedding_keys.clear()
+        self._cache_embedding_rows.clear()
+
+    def _evaluate(self, **inputs) -> dict[str, Any]:
+        """
+        Call the LLM for the given inputs, either one pair at a time or in batches of `batch_size` pairs.
+
+        :param inputs:
+            The input values to evaluate. The keys are the input names and the values are lists of input values.
+        :returns:
+            A dictionary with `results` and `meta` entries, in the same format as the output of `LLMEvaluator.run`.
+        """
+        if self.batch_size > 1:
+            return self._run_batched(**inputs)
+        return super(ContextRelevanceEvaluator, self).run(**inputs)
+
+    def _run_deduplicated(self, **inputs) -> dict[str, Any]:
+        """
+        Evaluate the inputs, sending each distinct question-contexts pair to the evaluation only once.
+
+        Results of duplicated pairs are copied back to all of their positions in the inputs.
+
+        :param inputs:
+            The input values to evaluate. The keys are the input names and the values are lists of input values.
+        :returns:
+            A dictionary with `results` and `meta` entries, in the same format as the output of `LLMEvaluator.run`.
+        """
+        self.validate_input_parameters(dict(self.inputs), inputs)
+        questions, contexts = inputs["questions"], inputs["contexts"]
+
+        keys = [
+            self._cache_key(question, question_contexts) for question, question_contexts in zip(questions, contexts)
+        ]
+        # maps each distinct key to the index of its first occurrence, in order of appearance
+        first_indices: dict[bytes, int] = {}
+        for idx, key in enumerate(keys):
+            first_indices.setdefault(key, idx)
+
+        unique_questions = [questions[idx] for idx in first_indices.values()]
+        unique_contexts = [contexts[idx] for idx in first_indices.values()]
+        if self.cache_results:
+            output = self._run_with_cache(
+                questions=unique_questions, contexts=unique_contexts, keys=list(first_indices)
+            )
+        else:
+            output = self._evaluate(questions=unique_questions, contexts=unique_contexts)
+
+        unique_results = dict(zip(first_indices, output["results"]))
+        results: list[Optional[dict[str, Any]]] = []
+        for idx, key in enumerate(keys):
+            res = unique_results[key]
+            # duplicates get their own copy since the results are updated in place when scoring
+            results.append(res if first_indices[key] == idx else copy.deepcopy(res))
+
+        return {"results": results, "meta": output["meta"]}
+
+    def _run_with_cache(self, questions: list[str], contexts: list[list[str]], keys: list[bytes]) -> dict[str, Any]:
+        """
+        Evaluate the inputs, calling the LLM only for the question-contexts pairs that are not cached yet.
+
+        :param questions:
+            A list of questions.
+        :param contexts:
+            A list of lists of contexts. Each list of contexts corresponds to one question.
+        :param keys:
+            The cache keys of the question-contexts pairs.
+        :returns:
+            A dictionary with `results` and `meta` entries, in the same format as the output of `LLMEvaluator.run`.
+            `meta` only contains the metadata of the LLM calls made for pairs that were not cached.
+        """
+        results: list[Optional[dict[str, Any]]] = [None] * len(questions)
+        misses: list[int] = []
+        for idx, key in enumerate(keys):
+            if key in self._cache:
+                results[idx] = self._get_cached(key)
+            else:
+                misses.append(idx)
+
+        embeddings: dict[int, np.ndarray] = {}
+        if misses and self.document_embedder is not None:
+            embeddings = dict(
+                zip(misses, self._embed([questions[idx] for idx in misses], [contexts[idx] for idx in misses]))
+            )
+            remaining_misses = []
+            for idx in misses:
+                similar_key = self._find_similar(embeddings[idx])
+                if similar_key is not None:
+                    results[idx] = self._get_cached(similar_key)
+                else:
+                    remaining_misses.append(idx)
+            misses = remaining_misses
+
+        if not misses:
+            return {"results": results, "meta": None}
+
+        output = self._evaluate(
+            questions=[questions[idx] for idx in misses], contexts=[contexts[idx] for idx in misses]
+        )
+        for idx, res in zip(misses, output["results"]):
+            results[idx] = res
+            if res is not None:
+                self._add_to_cache(keys[idx], res, embeddings.get(idx))
+
+        return {"results": results, "meta": output["meta"]}
+
+    def _get_cached(self, key: bytes) -> dict[str, Any]:
+        """
+        Return a copy of a cached result and mark it as the most recently used one.
+        """
+        self._cache.move_to_end(key)
+        return copy.deepcopy(self._cache[key])
+
+    def _add_to_cache(self, key: bytes, result: dict[str, Any], embedding: Optional[np.ndarray]) -> None:
+        """
+        Cache a result and its embedding, evicting the least recently used results if the cache is full.
+        """
+        while len(self._cache) >= self.max_cache_size:
+            evicted_key, _ = self._cache.popitem(last=False)
+            self._remove_embedding(evicted_key)
+
+        self._cache[key] = copy.deepcopy(result)
+        if embedding is None:
+            return
+
+        row = len(self._cache_embedding_keys)
+        if self._cache_embeddings is None or row == len(self._cache_embeddings):
+            # double the capacity of the matrix, without exceeding the maximum number of cached results
+            capacity = min(max(2 * row, 16), self.max_cache_size)
+            grown = np.empty((capacity, len(embedding)), dtype=np.float32)
+            if self._cache_embeddings is not None:
+                grown[:row] = self._cache_embeddings[:row]
+            self._cache_embeddings = grown
+        self._cache_embeddings[row] = embedding
+        self._cache_embedding_keys.append(key)
+        self._cache_embedding_rows[key] = row
+
+    def _remove_embedding(self, key: bytes) -> None:
+        """
+        Remove the embedding of a cached pair, moving the last row of the matrix into its place.
+        """
+        row = self._cache_embedding_rows.pop(key, None)
+        if row is None or self._cache_embeddings is None:
+            return
+        last_key = self._cache_embedding_keys.pop()
+        if last_key != key:
+            self._cache_embeddings[row] = self._cache_embeddings[len(self._cache_embedding_keys)]
+            self._cache_embedding_keys[row] = last_key
+            self._cache_embedding_rows[last_key] = row
+
+    @staticmethod
+    def _cache_key(question: str, contexts: list[str]) -> bytes:
+        """
+        Compute the key used to find duplicated and cached question-contexts pairs.
+
+        The key doesn't depend on the order of the contexts or on leading and trailing whitespace.
+        It is hashed with `xxhash` if it is installed, and with `hashlib.blake2b` otherwise.
+        """
+        normalized_contexts = sorted(context.strip() for context in contexts)
+        data = question.strip().encode() + b"\x00" + "\x1f".join(normalized_contexts).encode()
+        return _hash_digest(data)
+
+    def _embed(self, questions: list[str], contexts: list[list[str]]) -> np.ndarray:
+        """
+        Embed question-contexts pairs with a single call to the document embedder.
+
+        :returns:
+            A matrix with one embedding per pair, normalized to unit length.
+        """
+        documents = [
+            Document(content="\n".join([question, *question_contexts]))
+            for question, question_contexts in zip(questions, contexts)
+        ]
+        embedded_documents = self.document_embedder.run(documents=documents)["documents"]  # type: ignore[union-attr]
+        embeddings = np.asarray([doc.embedding for doc in embedded_documents], dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.where(norms > 0, norms, 1)
+
+    def _find_similar(self, embedding: np.ndarray) -> Optional[bytes]:
+        """
+        Return the cache key of the most similar cached pair if its similarity reaches `similarity_threshold`.
+        """
+        if self._cache_embeddings is None or not self._cache_embedding_keys:
+            return None
+        similarities = self._cache_embeddings[: len(self._cache_embedding_keys)] @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        return self._cache_embedding_keys[best]
+
+    def _run_batched(self, **inputs) -> dict[str, Any]:
+        """
+        Evaluate the inputs in batches of `batch_size` items, using one LLM call per batch.
+
+        :param inputs:
+            The input values to evaluate, already validated by `_run_deduplicated`. The keys are the input names and
+            the values are lists of input values.
+        :returns:
+            A dictionary with `results` and `meta` entries, in the same format as the output of `LLMEvaluator.run`.
+        """
+        input_names, values = inputs.keys(), list(zip(*inputs.values()))
+        list_of_input_names_to_values = [dict(zip(input_names, v)) for v in values]
+        batches = [
+            list_of_input_names_to_values[i : i + self.batch_size]
+            for i in range(0, len(list_of_input_names_to_values), self.batch_size)
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            batch_outputs = list(
+                tqdm(executor.map(self._run_batch, batches), total=len(batches), disable=not self.progress_bar)
+            )
+
+        results: list[Optional[dict[str, Any]]] = []
+        metadata = []
+        for batch_results, batch_meta in batch_outputs:
+            results.extend(batch_results)
+            if batch_meta:
+                metadata.append(batch_meta)
+
+        errors = sum(1 for res in results if res is None)
+        if errors > 0:
+            logger.warning("LLM evaluator failed for {errors} out of {len} inputs.", errors=errors, len=len(results))
+
+        return {"results": results, "meta": metadata or None}
+
+    def _run_batch(
+        self, batch: list[dict[str, Any]]
+    ) -> tuple[list[Optional[dict[str, Any]]], Optional[dict[str, Any]]]:
+        """
+        Evaluate a single batch of inputs with one LLM call.
+
+        :param batch:
+            A list of dictionaries mapping input names to the values of one item.
+        :returns:
+            A tuple with the list of parsed results, one per item, and the metadata of the LLM reply.
+            Results are `None` for items that could not be evaluated.
+        :raises ValueError:
+            If the LLM call fails or its reply is not a list of valid results, and `raise_on_failure` is set to True.
+        """
+        prompt = self._prepare_batch_prompt(batch)
+        messages = [ChatMessage.from_user(prompt)]
+        try:
+            result = self._chat_generator.run(messages=messages)
+        except Exception as e:
+            if self.raise_on_failure:
+                raise ValueError(f"Error while generating response for prompt: {prompt}. Error: {e}")
+            logger.warning("Error while generating response for prompt: {prompt}. Error: {e}", prompt=prompt, e=e)
+            return [None] * len(batch), None
+
+        reply = result["replies"][0]
+        parsed_reply = self._parse_json_with_expected_keys(expected=["results"], received=reply.text)
+        if parsed_reply is None:
+            return [None] * len(batch), reply.meta or None
+
+        parsed_results = parsed_reply["results"]
+        if not isinstance(parsed_results, list) or len(parsed_results) != len(batch):
+            msg = f"Expected response from LLM evaluator to contain a list of {len(batch)} results, got {reply.text}."
+            if self.raise_on_failure:
+                raise ValueError(msg)
+            logger.warning(msg)
+            return [None] * len(batch), reply.meta or None
+
+        results: list[Optional[dict[str, Any]]] = []
+        for idx, parsed_result in enumerate(parsed_results, start=1):
+            if isinstance(parsed_result, dict) and all(output in parsed_result for output in self.outputs):
+                results.append(parsed_result)
+                continue
+            if self.raise_on_failure:
+                raise ValueError(
+                    f"Expected result {idx} from LLM evaluator to be JSON with keys {self.outputs}, "
+                    f"got {parsed_result}."
+                )
+            logger.warning(
+                "Expected result {idx} from LLM evaluator to be JSON with keys {expected}, got {received}.",
+                idx=idx,
+                expected=self.outputs,
+                received=parsed_result,
+            )
+            results.append(None)
+        return results, reply.meta or None
+
+    def _prepare_batch_prompt(self, batch: list[dict[str, Any]]) -> str:
+        """
+        Build a prompt that asks the LLM to evaluate several numbered items at once.
+
+        :param batch:
+            A list of dictionaries mapping input names to the values of one item.
+        :returns:
+            The prompt.
+        """
+        examples_section = self._prepare_batch_examples_section()
+        items_section = "\n".join([f"Item {idx}:\n{json.dumps(item)}" for idx, item in enumerate(batch, start=1)])
+        return (
+            f"Instructions:\n"
+            f"{self.instructions}\n\n"
+            f"You will receive {len(batch)} numbered items. Evaluate each item independently.\n"
+            f'Generate the response in JSON format with the key "results" containing a list with exactly one '
+            f"object per item, in the same order as the items. Each object must have the following keys:\n"
+            f"{json.dumps(self.outputs)}\n"
+            f"Consider the instructions and the examples below to determine those values.\n\n"
+            f"Examples:\n"
+            f"{examples_section}\n\n"
+            f"Items:\n"
+            f"{items_section}\n"
+            f"Outputs:\n"
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """
         Serialize this component to a dictionary.
@@ -200,6 +673,14 @@ class ContextRelevanceEvaluator(LLMEvaluator):
             examples=self.examples,
             progress_bar=self.progress_bar,
             raise_on_failure=self.raise_on_failure,
+            batch_size=self.batch_size,
+            max_workers=self.max_workers,
+            cache_results=self.cache_results,
+            max_cache_size=self.max_cache_size,
+            document_embedder=component_to_dict(obj=self.document_embedder, name="document_embedder")
+            if self.document_embedder
+            else None,
+            similarity_threshold=self.similarity_threshold,
         )
 
     @classmethod
@@ -214,4 +695,6 @@ class ContextRelevanceEvaluator(LLMEvaluator):
         """
         if data["init_parameters"].get("chat_generator"):
             deserialize_chatgenerator_inplace(data["init_parameters"], key="chat_generator")
+        if data["init_parameters"].get("document_embedder"):
+            deserialize_component_inplace(data["init_parameters"], key="document_embedder")
         return default_from_dict(cls, data)
@@ -13,10 +13,30 @@ from haystack.components.generators.chat.openai import OpenAIChatGenerator
 from haystack.components.generators.chat.types import ChatGenerator
 from haystack.core.serialization import component_to_dict
 from haystack.dataclasses.chat_message import ChatMessage
+from haystack.lazy_imports import LazyImport
 from haystack.utils import deserialize_chatgenerator_inplace, deserialize_type, serialize_type
 
 logger = logging.getLogger(__name__)
 
+# orjson is an optional, faster replacement for json to parse the replies of the LLM
+with LazyImport(message="Run 'pip install orjson'") as orjson_import:
+    import orjson
+
+
+def _json_loads(data: str) -> Any:
+    """
+    Parse a JSON string with orjson if it is installed, falling back to json.
+
+    orjson rejects some inputs that json accepts, such as `NaN`, `Infinity` and integers wider than 64 bits, so
+    json is tried again when orjson fails. Whether a reply is valid JSON doesn't depend on orjson being installed.
+    """
+    if orjson_import.is_successful():
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 @component
 class LLMEvaluator:
@@ -204,11 +224,11 @@ class LLMEvaluator:
                 errors += 1
                 continue
 
-            if self.is_valid_json_and_has_expected_keys(expected=self.outputs, received=result["replies"][0].text):
-                parsed_result = json.loads(result["replies"][0].text)
-                results.append(parsed_result)
-            else:
-                results.append(None)
+            parsed_result = self._parse_json_with_expected_keys(
+                expected=self.outputs, received=result["replies"][0].text
+            )
+            results.append(parsed_result)
+            if parsed_result is None:
                 errors += 1
 
             if result["replies"][0].meta:
@@ -249,12 +269,7 @@ class LLMEvaluator:
             "{" + ", ".join([f'"{input_socket[0]}": {{{{ {input_socket[0]} }}}}' for input_socket in self.inputs]) + "}"
         )
 
-        examples_section = "\n".join(
-            [
-                "Inputs:\n" + json.dumps(example["inputs"]) + "\nOutputs:\n" + json.dumps(example["outputs"])
-                for example in self.examples
-            ]
-        )
+        examples_section = self.prepare_examples_section()
         return (
             f"Instructions:\n"
             f"{self.instructions}\n\n"
@@ -268,6 +283,26 @@ class LLMEvaluator:
             f"Outputs:\n"
         )
 
+    def prepare_examples_section(self) -> str:
+        """
+        Prepare the few-shot examples section of the prompt template.
+
+        Each example is rendered with the following format:
+        Inputs:
+        `<example inputs as JSON>`
+        Outputs:
+        `<example outputs as JSON>`
+
+        :returns:
+            The examples section.
+        """
+        return "\n".join(
+            [
+                "Inputs:\n" + json.dumps(example["inputs"]) + "\nOutputs:\n" + json.dumps(example["outputs"])
+                for example in self.examples
+            ]
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """
         Serialize this component to a dictionary.
@@ -361,14 +396,33 @@ class LLMEvaluator:
         :returns:
             True if the received output is a valid JSON with the expected keys, False otherwise.
         """
+        return self._parse_json_with_expected_keys(expected=expected, received=received) is not None
+
+    def _parse_json_with_expected_keys(self, expected: list[str], received: str) -> Optional[Any]:
+        """
+        Parse the output of the LLM, checking that it is a valid JSON with the expected keys.
+
+        Uses `orjson` to parse the output if it is installed.
+
+        :param expected:
+            Names of expected outputs
+        :param received:
+            Names of received outputs
+
+        :raises ValueError:
+            If the output is not a valid JSON with the expected keys and `raise_on_failure` is set to True.
+
+        :returns:
+            The parsed output, or None if it is not a valid JSON with the expected keys.
+        """
         try:
-            parsed_output = json.loads(received)
+            parsed_output = _json_loads(received)
         except json.JSONDecodeError:
             msg = "Response from LLM evaluator is not a valid JSON."
             if self.raise_on_failure:
                 raise ValueError(msg)
             logger.warning(msg)
-            return False
+            return None
 
         if not all(output in parsed_output for output in expected):
             if self.raise_on_failure:
@@ -380,6 +434,6 @@ class LLMEvaluator:
                 expected=expected,
                 received=received,
             )
-            return False
+            return None
 
-        return True
+        return parsed_output
@@ -2,9 +2,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from dataclasses import asdict
+import io
 from datetime import datetime
-from typing import Any, Iterable, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union, cast
 
 from haystack import component, default_from_dict, default_to_dict, logging
 from haystack.dataclasses import (
@@ -20,17 +20,24 @@ from haystack.utils import Secret, deserialize_callable, deserialize_secrets_inp
 from haystack.utils.hf import HFGenerationAPIType, HFModelType, check_valid_model
 from haystack.utils.url_validation import is_valid_http_url
 
+# huggingface_hub loads its submodules lazily: importing the package is cheap, while importing the inference
+# client pulls in all of the generated inference types. The client is imported when a generator is created.
 with LazyImport(message="Run 'pip install \"huggingface_hub>=0.27.0\"'") as huggingface_hub_import:
-    from huggingface_hub import (
-        InferenceClient,
-        TextGenerationOutput,
-        TextGenerationStreamOutput,
-        TextGenerationStreamOutputToken,
-    )
+    import huggingface_hub  # noqa: F401
+
+if TYPE_CHECKING:
+    from huggingface_hub import TextGenerationOutput, TextGenerationStreamOutput, TextGenerationStreamOutputToken
 
 
 logger = logging.getLogger(__name__)
 
+# Maps the finish reasons returned by Text Generation Inference to the ones used in Haystack
+_FINISH_REASON_MAPPING: dict[str, FinishReason] = {
+    "length": "length",  # Direct match
+    "eos_token": "stop",  # EOS token means natural stop
+    "stop_sequence": "stop",  # Stop sequence means natural stop
+}
+
 
 @component
 class HuggingFaceAPIGenerator:
@@ -100,6 +107,7 @@ class HuggingFaceAPIGenerator:
         generation_kwargs: Optional[dict[str, Any]] = None,
         stop_words: Optional[list[str]] = None,
         streaming_callback: Optional[StreamingCallbackT] = None,
+        return_details: bool = True,
     ):
         """
         Initialize the HuggingFaceAPIGenerator instance.
@@ -126,6 +134,11 @@ class HuggingFaceAPIGenerator:
             for more information.
         :param stop_words: An optional list of strings representing the stop words.
         :param streaming_callback: An optional callable for handling streaming responses.
+        :param return_details:
+            Whether to request generation details, such as the finish reason and the generated tokens, for
+            non-streaming responses. Set it to False to reduce the size of the responses when you don't need the
+            `finish_reason` and `usage` metadata. In this case, they are both set to None.
+            Details are always requested when streaming.
         """
 
         huggingface_hub_import.check()
@@ -172,8 +185,11 @@ class HuggingFaceAPIGenerator:
         self.token = token
         self.generation_kwargs = generation_kwargs
         self.streaming_callback = streaming_callback
+        self.return_details = return_details
 
         resolved_api_params: dict[str, Any] = {k: v for k, v in api_params.items() if k != "model" and k != "url"}
+        from huggingface_hub import InferenceClient
+
         self._client = InferenceClient(
             model_or_url, token=token.resolve_value() if token else None, **resolved_api_params
         )
@@ -193,6 +209,7 @@ class HuggingFaceAPIGenerator:
             token=self.token.to_dict() if self.token else None,
             generation_kwargs=self.generation_kwargs,
             streaming_callback=callback_name,
+            return_details=self.return_details,
         )
 
     @classmethod
@@ -227,71 +244,96 @@ class HuggingFaceAPIGenerator:
             A dictionary with the generated replies and metadata. Both are lists of length n.
             - replies: A list of strings representing the generated replies.
         """
-        # update generation kwargs by merging with the default ones
-        generation_kwargs = {**self.generation_kwargs, **(generation_kwargs or {})}
+        # update generation kwargs by merging with the default ones, only copying them when there is something to merge
+        # (they are unpacked into the client call below, so the defaults are never mutated)
+        if generation_kwargs:
+            generation_kwargs = {**self.generation_kwargs, **generation_kwargs}
+        else:
+            generation_kwargs = self.generation_kwargs
 
         # check if streaming_callback is passed
         streaming_callback = select_streaming_callback(
             init_callback=self.streaming_callback, runtime_callback=streaming_callback, requires_async=False
         )
 
+        # streaming always needs details: without them, the client yields plain strings instead of tokens
         hf_output = self._client.text_generation(
-            prompt, details=True, stream=streaming_callback is not None, **generation_kwargs
+            prompt,
+            details=self.return_details or streaming_callback is not None,
+            stream=streaming_callback is not None,
+            **generation_kwargs,
         )
 
         if streaming_callback is not None:
             # mypy doesn't know that hf_output is a Iterable[TextGenerationStreamOutput], so we cast it
             return self._stream_and_build_response(
-                hf_output=cast(Iterable[TextGenerationStreamOutput], hf_output), streaming_callback=streaming_callback
+                hf_output=cast(Iterable["TextGenerationStreamOutput"], hf_output), streaming_callback=streaming_callback
             )
 
-        # mypy doesn't know that hf_output is a TextGenerationOutput, so we cast it
-        return self._build_non_streaming_response(cast(TextGenerationOutput, hf_output))
+        # mypy doesn't know that hf_output is a TextGenerationOutput or a str, so we cast it
+        return self._build_non_streaming_response(cast(Union[str, "TextGenerationOutput"], hf_output))
 
     def _stream_and_build_response(
         self, hf_output: Iterable["TextGenerationStreamOutput"], streaming_callback: SyncStreamingCallbackT
     ):
-        chunks: list[StreamingChunk] = []
+        # only the text and the metadata of the last chunk are needed to build the response, so we don't keep the
+        # streamed chunks around
+        buffer = io.StringIO()
+        last_chunk_metadata: dict[str, Any] = {}
         first_chunk_time = None
 
         component_info = ComponentInfo.from_component(self)
         for chunk in hf_output:
-            token: TextGenerationStreamOutputToken = chunk.token
+            token: "TextGenerationStreamOutputToken" = chunk.token
             if token.special:
                 continue
 
-            chunk_metadata = {**asdict(token), **(asdict(chunk.details) if chunk.details else {})}
-            if first_chunk_time is None:
+            # build the metadata from plain attribute reads: dataclasses.asdict deep-copies every field on each token
+            chunk_metadata = {"id": token.id, "text": token.text, "logprob": token.logprob, "special": token.special}
+            # details, and thus the finish reason, are only sent with the last token of the stream
+            mapped_finish_reason = None
+            if details := chunk.details:
+                chunk_metadata.update(
+                    {
+                        "finish_reason": details.finish_reason,
+                        "generated_tokens": details.generated_tokens,
+                        "input_length": details.input_length,
+                        "seed": details.seed,
+                    }
+                )
+                if details.finish_reason:
+                    mapped_finish_reason = _FINISH_REASON_MAPPING.get(details.finish_reason, "stop")
+
+            is_first_chunk = first_chunk_time is None
+            if is_first_chunk:
                 first_chunk_time = datetime.now().isoformat()
 
-            mapping: dict[str, FinishReason] = {
-                "length": "length",  # Direct match
-                "eos_token": "stop",  # EOS token means natural stop
-                "stop_sequence": "stop",  # Stop sequence means natural stop
-            }
-            mapped_finish_reason = (
-                mapping.get(chunk_metadata["finish_reason"], "stop") if chunk_metadata.get("finish_reason") else None
-            )
             stream_chunk = StreamingChunk(
                 content=token.text,
                 meta=chunk_metadata,
                 component_info=component_info,
                 index=0,
-                start=len(chunks) == 0,
+                start=is_first_chunk,
                 finish_reason=mapped_finish_reason,
             )
-            chunks.append(stream_chunk)
+            buffer.write(token.text)
+            last_chunk_metadata = chunk_metadata
             streaming_callback(stream_chunk)
 
         metadata = {
-            "finish_reason": chunks[-1].meta.get("finish_reason", None),
+            "finish_reason": last_chunk_metadata.get("finish_reason", None),
             "model": self._client.model,
-            "usage": {"completion_tokens": chunks[-1].meta.get("generated_tokens", 0)},
+            "usage": {"completion_tokens": last_chunk_metadata.get("generated_tokens", 0)},
             "completion_start_time": first_chunk_time,
         }
-        return {"replies": ["".join([chunk.content for chunk in chunks])], "meta": [metadata]}
+        return {"replies": [buffer.getvalue()], "meta": [metadata]}
+
+    def _build_non_streaming_response(self, hf_output: Union[str, "TextGenerationOutput"]):
+        if isinstance(hf_output, str):
+            # without details, the client only returns the generated text
+            meta: list[dict[str, Any]] = [{"model": self._client.model, "finish_reason": None, "usage": None}]
+            return {"replies": [hf_output], "meta": meta}
 
-    def _build_non_streaming_response(self, hf_output: "TextGenerationOutput"):
         meta = [
             {
                 "model": self._client.model,
@@ -2,7 +2,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import sys
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from typing import Any, Awaitable, Callable, Literal, Optional, Union, overload
 
 from haystack.core.component import Component
@@ -13,6 +15,10 @@ from haystack.utils.asynchronous import is_callable_async_compatible
 # plus Haystack-specific value ("tool_call_results")
 FinishReason = Literal["stop", "length", "tool_calls", "content_filter", "tool_call_results"]
 
+# Streaming creates one StreamingChunk per token, so the dataclasses created in the streaming loop use slots to avoid
+# the memory overhead of an instance __dict__. `slots` is only supported by dataclasses from Python 3.10 on.
+_SLOTS_KWARGS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class ToolCallDelta:
@@ -49,7 +55,17 @@ class ToolCallDelta:
         return ToolCallDelta(**data)
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _component_type(component_class: type) -> str:
+    """
+    Return the fully qualified name of a component class, computed once per class.
+
+    The component name isn't cached with it since it changes when the component is added to a pipeline.
+    """
+    return f"{component_class.__module__}.{component_class.__name__}"
+
+
+@dataclass(**_SLOTS_KWARGS)
 class ComponentInfo:
     """
     The `ComponentInfo` class encapsulates information about a component.
@@ -72,9 +88,8 @@ class ComponentInfo:
         :returns:
             The `ComponentInfo` object with the type and name of the given component.
         """
-        component_type = f"{component.__class__.__module__}.{component.__class__.__name__}"
         component_name = getattr(component, "__component_name__", None)
-        return cls(type=component_type, name=component_name)
+        return cls(type=_component_type(component.__class__), name=component_name)
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -95,7 +110,7 @@ class ComponentInfo:
         return ComponentInfo(**data)
 
 
-@dataclass
+@dataclass(**_SLOTS_KWARGS)
 class StreamingChunk:
     """
     The `StreamingChunk` class encapsulates a segment of streamed content along with associated metadata.
@@ -222,16 +237,15 @@ def select_streaming_callback(
     :returns:
         The selected callback.
     """
-    if init_callback is not None:
-        if requires_async and not is_callable_async_compatible(init_callback):
+    # each callback is checked once: a mismatch in either direction is an error
+    if init_callback is not None and is_callable_async_compatible(init_callback) != requires_async:
+        if requires_async:
             raise ValueError("The init callback must be async compatible.")
-        if not requires_async and is_callable_async_compatible(init_callback):
-            raise ValueError("The init callback cannot be a coroutine.")
+        raise ValueError("The init callback cannot be a coroutine.")
 
-    if runtime_callback is not None:
-        if requires_async and not is_callable_async_compatible(runtime_callback):
+    if runtime_callback is not None and is_callable_async_compatible(runtime_callback) != requires_async:
+        if requires_async:
             raise ValueError("The runtime callback must be async compatible.")
-        if not requires_async and is_callable_async_compatible(runtime_callback):
-            raise ValueError("The runtime callback cannot be a coroutine.")
+        raise ValueError("The runtime callback cannot be a coroutine.")
 
     return runtime_callback or init_callback
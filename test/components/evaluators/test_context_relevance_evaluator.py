@@ -8,8 +8,10 @@ import os
 import pytest
 
 from haystack import Pipeline
+from haystack.components.builders import PromptBuilder
 from haystack.components.evaluators import ContextRelevanceEvaluator
 from haystack.components.generators.chat.openai import OpenAIChatGenerator
+from haystack.dataclasses import Document
 from haystack.dataclasses.chat_message import ChatMessage
 from haystack.utils.auth import Secret
 
@@ -55,6 +57,34 @@ class TestContextRelevanceEvaluator:
         assert component._chat_generator.client.api_key == "test-api-key"
         assert component._chat_generator.generation_kwargs == {"response_format": {"type": "json_object"}, "seed": 42}
 
+    def test_init_default_reuses_rendered_template(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        first = ContextRelevanceEvaluator()
+        second = ContextRelevanceEvaluator()
+        custom = ContextRelevanceEvaluator(
+            examples=[{"inputs": {"questions": "What is football?"}, "outputs": {"relevant_statements": []}}]
+        )
+
+        assert first.builder._template_string is second.builder._template_string
+        assert first.prepare_template() is second.prepare_template()
+        assert "What is football?" in custom.builder._template_string
+        assert "What is football?" not in first.builder._template_string
+
+    def test_subclass_does_not_reuse_default_template(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+
+        class CustomInstructionsEvaluator(ContextRelevanceEvaluator):
+            def __init__(self):
+                super().__init__()
+                self.instructions = "Custom instructions."
+                self.builder = PromptBuilder(template=self.prepare_template())
+
+        ContextRelevanceEvaluator()
+        component = CustomInstructionsEvaluator()
+
+        assert "Custom instructions." in component.builder._template_string
+        assert "Custom instructions." not in ContextRelevanceEvaluator().builder._template_string
+
     def test_init_fail_wo_openai_api_key(self, monkeypatch):
         monkeypatch.delenv("OPENAI_API_KEY", raising=False)
         with pytest.raises(ValueError, match="None of the .* environment variables are set"):
@@ -106,6 +136,12 @@ class TestContextRelevanceEvaluator:
                 "examples": [{"inputs": {"questions": "What is football?"}, "outputs": {"score": 0}}],
                 "progress_bar": False,
                 "raise_on_failure": False,
+                "batch_size": 1,
+                "max_workers": 3,
+                "cache_results": False,
+                "max_cache_size": 10000,
+                "document_embedder": None,
+                "similarity_threshold": 0.95,
             },
         }
 
@@ -202,6 +238,283 @@ class TestContextRelevanceEvaluator:
             "individual_scores": [1, 0],
         }
 
+    def test_init_invalid_batch_size(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+            ContextRelevanceEvaluator(batch_size=0)
+
+    def test_init_invalid_max_cache_size(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        with pytest.raises(ValueError, match="max_cache_size must be a positive integer"):
+            ContextRelevanceEvaluator(max_cache_size=0)
+
+    def test_run_batched(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator(batch_size=2)
+        prompts = []
+
+        def chat_generator_run(self, *args, **kwargs):
+            prompt = kwargs["messages"][0].text
+            prompts.append(prompt)
+            if "What is Java?" in prompt:
+                return {"replies": [ChatMessage.from_assistant('{"results": [{"relevant_statements": ["b"]}]}')]}
+            return {
+                "replies": [
+                    ChatMessage.from_assistant(
+                        '{"results": [{"relevant_statements": ["a"]}, {"relevant_statements": []}]}'
+                    )
+                ]
+            }
+
+        monkeypatch.setattr("haystack.components.evaluators.llm_evaluator.OpenAIChatGenerator.run", chat_generator_run)
+
+        questions = ["What is Football?", "Who created Python?", "What is Java?"]
+        contexts = [["Football is a sport."], ["Paris is in France."], ["Java is a programming language."]]
+        results = component.run(questions=questions, contexts=contexts)
+
+        assert len(prompts) == 2
+        assert results == {
+            "results": [
+                {"relevant_statements": ["a"], "score": 1},
+                {"relevant_statements": [], "score": 0},
+                {"relevant_statements": ["b"], "score": 1},
+            ],
+            "score": 2 / 3,
+            "meta": None,
+            "individual_scores": [1, 0, 1],
+        }
+
+    def test_run_batched_wrong_number_of_results_raise_on_failure_false(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator(batch_size=2, raise_on_failure=False)
+
+        def chat_generator_run(self, *args, **kwargs):
+            return {"replies": [ChatMessage.from_assistant('{"results": [{"relevant_statements": ["a"]}]}')]}
+
+        monkeypatch.setattr("haystack.components.evaluators.llm_evaluator.OpenAIChatGenerator.run", chat_generator_run)
+
+        results = component.run(questions=["q1", "q2"], contexts=[["c1"], ["c2"]])
+
+        assert math.isnan(results["score"])
+        assert all(res["relevant_statements"] == [] for res in results["results"])
+        assert all(math.isnan(res["score"]) for res in results["results"])
+
+    def test_run_batched_wrong_number_of_results_raise_on_failure_true(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator(batch_size=2)
+
+        def chat_generator_run(self, *args, **kwargs):
+            return {"replies": [ChatMessage.from_assistant('{"results": [{"relevant_statements": ["a"]}]}')]}
+
+        monkeypatch.setattr("haystack.components.evaluators.llm_evaluator.OpenAIChatGenerator.run", chat_generator_run)
+
+        with pytest.raises(ValueError, match="to contain a list of 2 results"):
+            component.run(questions=["q1", "q2"], contexts=[["c1"], ["c2"]])
+
+    def test_run_batched_malformed_result_raise_on_failure_false(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator(batch_size=2, raise_on_failure=False)
+
+        def chat_generator_run(self, *args, **kwargs):
+            return {"replies": [ChatMessage.from_assistant('{"results": [{"relevant_statements": ["a"]}, "b"]}')]}
+
+        monkeypatch.setattr("haystack.components.evaluators.llm_evaluator.OpenAIChatGenerator.run", chat_generator_run)
+
+        results = component.run(questions=["q1", "q2"], contexts=[["c1"], ["c2"]])
+
+        assert results["results"][0] == {"relevant_statements": ["a"], "score": 1}
+        assert results["results"][1]["relevant_statements"] == []
+        assert math.isnan(results["results"][1]["score"])
+
+    def test_run_batched_malformed_result_raise_on_failure_true(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator(batch_size=2)
+
+        def chat_generator_run(self, *args, **kwargs):
+            return {"replies": [ChatMessage.from_assistant('{"results": [{"relevant_statements": ["a"]}, {"b": []}]}')]}
+
+        monkeypatch.setattr("haystack.components.evaluators.llm_evaluator.OpenAIChatGenerator.run", chat_generator_run)
+
+        with pytest.raises(ValueError, match="Expected result 2 from LLM evaluator"):
+            component.run(questions=["q1", "q2"], contexts=[["c1"], ["c2"]])
+
+    def test_prepare_batch_prompt_renders_examples_as_batch(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator(
+            batch_size=2,
+            examples=[
+                {"inputs": {"questions": "q", "contexts": ["c"]}, "outputs": {"relevant_statements": ["c"]}},
+                {"inputs": {"questions": "q2", "contexts": ["c2"]}, "outputs": {"relevant_statements": []}},
+            ],
+        )
+
+        prompt = component._prepare_batch_prompt([{"questions": "q3", "contexts": ["c3"]}])
+
+        assert (
+            'Examples:\nItems:\nItem 1:\n{"questions": "q", "contexts": ["c"]}\n'
+            'Item 2:\n{"questions": "q2", "contexts": ["c2"]}\n'
+            'Outputs:\n{"results": [{"relevant_statements": ["c"]}, {"relevant_statements": []}]}\n'
+        ) in prompt
+
+    def test_run_deduplicates_pairs(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator()
+        prompts = []
+
+        def chat_generator_run(self, *args, **kwargs):
+            prompts.append(kwargs["messages"][0].text)
+            if "Football" in kwargs["messages"][0].text:
+                return {"replies": [ChatMessage.from_assistant('{"relevant_statements": ["a"]}')]}
+            return {"replies": [ChatMessage.from_assistant('{"relevant_statements": []}')]}
+
+        monkeypatch.setattr("haystack.components.evaluators.llm_evaluator.OpenAIChatGenerator.run", chat_generator_run)
+
+        questions = ["What is Football?", "Who created Python?", "What is Football?"]
+        contexts = [["Football is a sport."], ["Paris is in France."], ["Football is a sport."]]
+        results = component.run(questions=questions, contexts=contexts)
+
+        assert len(prompts) == 2
+        assert results["results"] == [
+            {"relevant_statements": ["a"], "score": 1},
+            {"relevant_statements": [], "score": 0},
+            {"relevant_statements": ["a"], "score": 1},
+        ]
+        assert results["results"][0] is not results["results"][2]
+        assert results["individual_scores"] == [1, 0, 1]
+
+    def test_run_with_cache(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator(cache_results=True)
+        prompts = []
+
+        def chat_generator_run(self, *args, **kwargs):
+            prompts.append(kwargs["messages"][0].text)
+            return {"replies": [ChatMessage.from_assistant('{"relevant_statements": ["a"]}')]}
+
+        monkeypatch.setattr("haystack.components.evaluators.llm_evaluator.OpenAIChatGenerator.run", chat_generator_run)
+
+        first = component.run(questions=["What is Football?"], contexts=[["Football is a sport.", "Paris is a city."]])
+        assert len(prompts) == 1
+
+        # same pair with contexts in a different order and extra whitespace is served from the cache
+        second = component.run(
+            questions=["What is Football? "], contexts=[["Paris is a city.", "Football is a sport."]]
+        )
+        assert len(prompts) == 1
+        assert second["results"] == first["results"] == [{"relevant_statements": ["a"], "score": 1}]
+        assert second["meta"] is None
+
+        component.run(questions=["What is Python?"], contexts=[["Python is a language."]])
+        assert len(prompts) == 2
+
+    def test_run_with_cache_does_not_cache_failures(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator(cache_results=True, raise_on_failure=False)
+        calls = []
+
+        def chat_generator_run(self, *args, **kwargs):
+            calls.append(1)
+            raise Exception("OpenAI API request failed.")
+
+        monkeypatch.setattr("haystack.components.evaluators.llm_evaluator.OpenAIChatGenerator.run", chat_generator_run)
+
+        for _ in range(2):
+            result = component.run(questions=["What is Football?"], contexts=[["Football is a sport."]])
+            assert math.isnan(result["score"])
+        assert len(calls) == 2
+
+    def test_run_with_similarity_cache(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        embedder_calls = []
+
+        class FakeEmbedder:
+            def run(self, documents: list[Document]):
+                embedder_calls.append(len(documents))
+                return {
+                    "documents": [
+                        Document(content=doc.content, embedding=[1.0, 0.0] if "Football" in doc.content else [0.0, 1.0])
+                        for doc in documents
+                    ]
+                }
+
+        component = ContextRelevanceEvaluator(cache_results=True, document_embedder=FakeEmbedder())
+        prompts = []
+
+        def chat_generator_run(self, *args, **kwargs):
+            prompts.append(kwargs["messages"][0].text)
+            return {"replies": [ChatMessage.from_assistant('{"relevant_statements": ["a"]}')]}
+
+        monkeypatch.setattr("haystack.components.evaluators.llm_evaluator.OpenAIChatGenerator.run", chat_generator_run)
+
+        component.run(questions=["What is Football?"], contexts=[["Football is a sport."]])
+        result = component.run(
+            questions=["What's Football?", "What is Python?"],
+            contexts=[["Football is a game."], ["Python is a language."]],
+        )
+        # the pairs that are not cached are embedded with one call
+        assert embedder_calls == [1, 2]
+        assert len(prompts) == 2
+        assert result["results"] == [
+            {"relevant_statements": ["a"], "score": 1},
+            {"relevant_statements": ["a"], "score": 1},
+        ]
+
+    def test_run_with_cache_evicts_least_recently_used(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+
+        class FakeEmbedder:
+            def run(self, documents: list[Document]):
+                return {
+                    "documents": [
+                        Document(content=doc.content, embedding=[1.0, 0.0] if "Football" in doc.content else [0.0, 1.0])
+                        for doc in documents
+                    ]
+                }
+
+        component = ContextRelevanceEvaluator(cache_results=True, max_cache_size=1, document_embedder=FakeEmbedder())
+        prompts = []
+
+        def chat_generator_run(self, *args, **kwargs):
+            prompts.append(kwargs["messages"][0].text)
+            return {"replies": [ChatMessage.from_assistant('{"relevant_statements": ["a"]}')]}
+
+        monkeypatch.setattr("haystack.components.evaluators.llm_evaluator.OpenAIChatGenerator.run", chat_generator_run)
+
+        component.run(questions=["What is Football?"], contexts=[["Football is a sport."]])
+        component.run(questions=["What is Python?"], contexts=[["Python is a language."]])
+        assert len(prompts) == 2
+        assert len(component._cache) == 1
+
+        # the football pair and its embedding were evicted
+        component.run(questions=["What's Football?"], contexts=[["Football is a game."]])
+        assert len(prompts) == 3
+
+    def test_clear_cache(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator(cache_results=True)
+        prompts = []
+
+        def chat_generator_run(self, *args, **kwargs):
+            prompts.append(kwargs["messages"][0].text)
+            return {"replies": [ChatMessage.from_assistant('{"relevant_statements": ["a"]}')]}
+
+        monkeypatch.setattr("haystack.components.evaluators.llm_evaluator.OpenAIChatGenerator.run", chat_generator_run)
+
+        component.run(questions=["What is Football?"], contexts=[["Football is a sport."]])
+        component.clear_cache()
+        component.run(questions=["What is Football?"], contexts=[["Football is a sport."]])
+        assert len(prompts) == 2
+
+    def test_run_empty_inputs(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator()
+
+        results = component.run(questions=[], contexts=[])
+
+        assert results["results"] == []
+        assert results["individual_scores"] == []
+        assert math.isnan(results["score"])
+
     def test_run_missing_parameters(self, monkeypatch):
         monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
         component = ContextRelevanceEvaluator()
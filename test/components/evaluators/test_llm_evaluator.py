@@ -399,6 +399,22 @@ class TestLLMEvaluator:
         with pytest.raises(ValueError):
             component.is_valid_json_and_has_expected_keys(expected=["score"], received='{"wrong_name": 1.0}')
 
+    def test_output_json_accepted_by_json_module(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = LLMEvaluator(
+            instructions="test-instruction",
+            inputs=[("predicted_answers", list[str])],
+            outputs=["score"],
+            examples=[
+                {"inputs": {"predicted_answers": "Football is the most popular sport."}, "outputs": {"score": 0}}
+            ],
+        )
+        # orjson rejects these replies, json accepts them
+        assert component.is_valid_json_and_has_expected_keys(expected=["score"], received='{"score": NaN}')
+        assert component.is_valid_json_and_has_expected_keys(
+            expected=["score"], received='{"score": 18446744073709551616}'
+        )
+
     def test_output_invalid_json_raise_on_failure_false(self, monkeypatch):
         monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
         component = LLMEvaluator(
@@ -144,6 +144,7 @@ class TestHuggingFaceAPIGenerator:
             "stop_sequences": ["stop", "words"],
             "max_new_tokens": 512,
         }
+        assert init_params["return_details"] is True
 
     def test_from_dict(self, mock_check_valid_model):
         generator = HuggingFaceAPIGenerator(
@@ -219,6 +220,8 @@ class TestHuggingFaceAPIGenerator:
             "stream": False,
             "temperature": 0.8,
         }
+        # the runtime generation kwargs don't leak into the defaults of the component
+        assert generator.generation_kwargs == {"max_new_tokens": 512, "stop_sequences": []}
 
         # Assert that the response contains the generated replies and the right response
         assert "replies" in response
@@ -233,14 +236,49 @@ class TestHuggingFaceAPIGenerator:
         assert len(response["meta"]) > 0
         assert [isinstance(reply, str) for reply in response["replies"]]
 
+    def test_generate_text_without_details(self, mock_check_valid_model, mock_text_generation):
+        generator = HuggingFaceAPIGenerator(
+            api_type=HFGenerationAPIType.SERVERLESS_INFERENCE_API,
+            api_params={"model": "HuggingFaceH4/zephyr-7b-beta"},
+            return_details=False,
+        )
+        mock_text_generation.return_value = "I'm fine, thanks."
+
+        response = generator.run("How are you?")
+
+        _, kwargs = mock_text_generation.call_args
+        assert kwargs == {"details": False, "stop_sequences": [], "stream": False, "max_new_tokens": 512}
+        assert response == {
+            "replies": ["I'm fine, thanks."],
+            "meta": [{"model": "HuggingFaceH4/zephyr-7b-beta", "finish_reason": None, "usage": None}],
+        }
+
+    def test_generate_text_with_streaming_callback_without_details_still_requests_details(
+        self, mock_check_valid_model, mock_text_generation
+    ):
+        generator = HuggingFaceAPIGenerator(
+            api_type=HFGenerationAPIType.SERVERLESS_INFERENCE_API,
+            api_params={"model": "HuggingFaceH4/zephyr-7b-beta"},
+            streaming_callback=streaming_callback_handler,
+            return_details=False,
+        )
+        mock_text_generation.return_value = iter([])
+
+        generator.run("How are you?")
+
+        _, kwargs = mock_text_generation.call_args
+        assert kwargs["details"] is True
+
     def test_generate_text_with_streaming_callback(self, mock_check_valid_model, mock_text_generation):
         streaming_call_count = 0
+        streamed_chunks = []
 
         # Define the streaming callback function
         def streaming_callback_fn(chunk: StreamingChunk):
             nonlocal streaming_call_count
             streaming_call_count += 1
             assert isinstance(chunk, StreamingChunk)
+            streamed_chunks.append(chunk)
 
         generator = HuggingFaceAPIGenerator(
             api_type=HFGenerationAPIType.SERVERLESS_INFERENCE_API,
@@ -277,6 +315,20 @@ class TestHuggingFaceAPIGenerator:
 
         # Assert that the streaming callback was called twice
         assert streaming_call_count == 2
+        assert streamed_chunks[0].meta == {"id": 1, "text": "I'm fine, thanks.", "logprob": 0.0, "special": False}
+        assert streamed_chunks[0].finish_reason is None
+        assert streamed_chunks[1].meta == {
+            "id": 1,
+            "text": "Ok bye",
+            "logprob": 0.0,
+            "special": False,
+            "finish_reason": "length",
+            "generated_tokens": 5,
+            "input_length": 10,
+            "seed": None,
+        }
+        assert streamed_chunks[1].finish_reason == "length"
+        assert [chunk.start for chunk in streamed_chunks] == [True, False]
 
         # Assert that the response contains the generated replies
         assert "replies" in response
@@ -290,6 +342,55 @@ class TestHuggingFaceAPIGenerator:
         assert len(response["meta"]) > 0
         assert [isinstance(meta, dict) for meta in response["meta"]]
 
+        assert response["replies"] == ["I'm fine, thanks.Ok bye"]
+        assert response["meta"][0]["finish_reason"] == "length"
+        assert response["meta"][0]["usage"] == {"completion_tokens": 5}
+
+    @pytest.mark.parametrize(
+        "hf_finish_reason, expected", [("length", "length"), ("eos_token", "stop"), ("stop_sequence", "stop")]
+    )
+    def test_generate_text_with_streaming_callback_maps_finish_reason(
+        self, mock_check_valid_model, mock_text_generation, hf_finish_reason, expected
+    ):
+        streamed_chunks = []
+        generator = HuggingFaceAPIGenerator(
+            api_type=HFGenerationAPIType.SERVERLESS_INFERENCE_API,
+            api_params={"model": "HuggingFaceH4/zephyr-7b-beta"},
+            streaming_callback=streamed_chunks.append,
+        )
+        mock_text_generation.return_value = iter(
+            [
+                TextGenerationStreamOutput(
+                    index=0,
+                    generated_text=None,
+                    token=TextGenerationOutputToken(id=1, text="Hello", logprob=0.0, special=False),
+                    details=TextGenerationStreamOutputStreamDetails(
+                        finish_reason=hf_finish_reason, generated_tokens=1, seed=None, input_length=3
+                    ),
+                )
+            ]
+        )
+
+        response = generator.run("prompt")
+
+        assert streamed_chunks[0].finish_reason == expected
+        assert response["meta"][0]["finish_reason"] == hf_finish_reason
+
+    def test_generate_text_with_streaming_callback_empty_stream(self, mock_check_valid_model, mock_text_generation):
+        generator = HuggingFaceAPIGenerator(
+            api_type=HFGenerationAPIType.SERVERLESS_INFERENCE_API,
+            api_params={"model": "HuggingFaceH4/zephyr-7b-beta"},
+            streaming_callback=streaming_callback_handler,
+        )
+        mock_text_generation.return_value = iter([])
+
+        response = generator.run("prompt")
+
+        assert response["replies"] == [""]
+        assert response["meta"][0]["finish_reason"] is None
+        assert response["meta"][0]["usage"] == {"completion_tokens": 0}
+        assert response["meta"][0]["completion_start_time"] is None
+
     @pytest.mark.flaky(reruns=5, reruns_delay=5)
     @pytest.mark.integration
     @pytest.mark.slow
@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import sys
+
 import pytest
 
 from haystack import Pipeline, component
@@ -12,6 +14,7 @@ from haystack.dataclasses import (
     ToolCall,
     ToolCallDelta,
     ToolCallResult,
+    select_streaming_callback,
 )
 
 
@@ -110,6 +113,27 @@ def test_component_info_from_component_with_name_from_pipeline():
     assert component_info.name == "pipeline_component"
 
 
+def test_component_info_from_component_picks_up_name_set_after_first_call():
+    comp = ExampleComponent()
+    assert ComponentInfo.from_component(comp).name is None
+
+    pipeline = Pipeline()
+    pipeline.add_component("pipeline_component", comp)
+    component_info = ComponentInfo.from_component(comp)
+    assert component_info.type == "test_streaming_chunk.ExampleComponent"
+    assert component_info.name == "pipeline_component"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10 or later")
+def test_streaming_chunk_and_component_info_use_slots():
+    chunk = StreamingChunk(content="test", component_info=ComponentInfo(type="test.Component"))
+
+    assert not hasattr(chunk, "__dict__")
+    assert not hasattr(chunk.component_info, "__dict__")
+    with pytest.raises(AttributeError):
+        chunk.unknown_attribute = "value"
+
+
 def test_tool_call_delta():
     tool_call = ToolCallDelta(id="123", tool_name="test_tool", arguments='{"arg1": "value1"}', index=0)
     assert tool_call.id == "123"
@@ -330,3 +354,38 @@ def test_from_dict_reasoning():
     assert chunk.finish_reason == "stop"
     assert chunk.tool_calls is None
     assert chunk.tool_call_result is None
+
+
+def sync_callback(chunk: StreamingChunk) -> None:
+    pass
+
+
+async def async_callback(chunk: StreamingChunk) -> None:
+    pass
+
+
+def test_select_streaming_callback_runtime_takes_precedence():
+    def other_sync_callback(chunk: StreamingChunk) -> None:
+        pass
+
+    assert (
+        select_streaming_callback(sync_callback, runtime_callback=other_sync_callback, requires_async=False)
+        is other_sync_callback
+    )
+    assert select_streaming_callback(sync_callback, runtime_callback=None, requires_async=False) is sync_callback
+    assert select_streaming_callback(None, runtime_callback=async_callback, requires_async=True) is async_callback
+    assert select_streaming_callback(None, runtime_callback=None, requires_async=False) is None
+
+
+@pytest.mark.parametrize(
+    "init_callback, runtime_callback, requires_async, error",
+    [
+        (async_callback, None, False, "The init callback cannot be a coroutine."),
+        (sync_callback, None, True, "The init callback must be async compatible."),
+        (None, async_callback, False, "The runtime callback cannot be a coroutine."),
+        (None, sync_callback, True, "The runtime callback must be async compatible."),
+    ],
+)
+def test_select_streaming_callback_incompatible(init_callback, runtime_callback, requires_async, error):
+    with pytest.raises(ValueError, match=error):
+        select_streaming_callback(init_callback, runtime_callback=runtime_callback, requires_async=requires_async)